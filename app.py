@@ -1,9 +1,10 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.ticker import MaxNLocator
 import math
-from game_engine import play_game, play_optimal_game, play_human_game, play_bayesian_game, get_human_probabilities
+from game_engine import play_game, play_human_game, play_bayesian_game, get_human_probabilities, play_batch, replay_game, simulate_limits, counts_by_limit
 
 # --- GLOBAL CONFIGURATION ---
 # Change these values to resize ALL plots at once
@@ -13,6 +14,12 @@ PLOT_CONFIG = {
 }
 # ----------------------------
 
+def new_figure():
+    # Not pyplot: its current figure is shared by every session's thread, and the
+    # figures it creates are never freed
+    fig = Figure(figsize=PLOT_CONFIG["figsize"], dpi=PLOT_CONFIG["dpi"])
+    return fig, fig.subplots()
+
 st.set_page_config(page_title="Higher or Lower Analysis", layout="wide")
 
 st.title("🎲 Higher or Lower: The Mathematics of Guessing")
@@ -38,7 +45,7 @@ def draw_game_safe(result):
             point_cols.append('green')
 
     # USE GLOBAL CONFIG
-    fig, ax = plt.subplots(figsize=PLOT_CONFIG["figsize"], dpi=PLOT_CONFIG["dpi"])
+    fig, ax = new_figure()
 
     ax.axhline(y=target, color='green', linestyle='--', label='Target')
     ax.plot(attempts, history, color='grey', alpha=0.5)
@@ -50,7 +57,7 @@ def draw_game_safe(result):
     ax.set_ylim(1, limit)
     ax.xaxis.set_major_locator(MaxNLocator(integer=True))
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 # Create the tabs
@@ -75,8 +82,8 @@ with tab1:
 
     if st.button("Run Simulation", key="btn_sim"):
         with st.spinner("Simulating..."):
-            results = [play_game(sim_limit) for _ in range(sim_count)]
-            df_dist = pd.DataFrame(results)
+            records = play_batch(play_game, sim_limit, sim_count)
+            df_dist = pd.DataFrame(records)
 
             avg_attempts = df_dist['count'].mean()
             theoretical = 2 * math.log(sim_limit)
@@ -85,13 +92,14 @@ with tab1:
             m1, m2, m3 = st.columns(3)
             m1.metric("Average Guesses", f"{avg_attempts:.2f}")
             m2.metric("Theoretical (2 * ln N)", f"{theoretical:.2f}")
-            m3.metric("Max Guesses", df_dist['count'].max())
+            m3.metric("Max Guesses", int(df_dist['count'].max()))
 
             # PLOTTING WITH GLOBAL CONFIG
-            fig, ax = plt.subplots(figsize=PLOT_CONFIG["figsize"], dpi=PLOT_CONFIG["dpi"])
+            fig, ax = new_figure()
 
-            df_dist['count'].hist(bins=range(1, df_dist['count'].max() + 2),
-                                ax=ax, edgecolor='black', alpha=0.7)
+            ax.hist(df_dist['count'], bins=range(1, df_dist['count'].max() + 2),
+                    edgecolor='black', alpha=0.7)
+            ax.grid(True)
             ax.axvline(avg_attempts, color='red', linestyle='dashed', label=f'Mean: {avg_attempts:.2f}')
             ax.set_title(f"Distribution of Guesses (N={sim_limit})")
             ax.set_xlabel("Guesses Needed")
@@ -116,7 +124,7 @@ with tab2:
     if inspect_mode == "Play New Random Game":
         insp_limit = st.number_input("Game Limit", value=100, step=10, key="insp_limit")
         if st.button("Play & Plot"):
-            result = play_game(insp_limit)
+            result = play_game(insp_limit, keep_history=True)
             fig = draw_game_safe(result)
 
             c1, c2, c3 = st.columns([1, 4, 1])
@@ -131,12 +139,8 @@ with tab2:
 
             st.info(f"Showing a game that took {max_attempts} guesses!")
 
-            worst_game_data = {
-                "history": worst_game['history'],
-                "target": worst_game['target'],
-                "limit": sim_limit if 'sim_limit' in locals() else 10000,
-                "count": worst_game['count']
-            }
+            # Only (seed, target, count) is stored, so regenerate the path on demand
+            worst_game_data = replay_game(play_game, worst_game, upper_bound=st.session_state['sim_limit'])
 
             fig = draw_game_safe(worst_game_data)
 
@@ -157,14 +161,12 @@ with tab3:
             sim_counts = [10, 50, 100, 500, 1000, 5000]
             summary_data = []
 
-            progress_bar = st.progress(0)
-            total_steps = len(limits_to_test)
-            step_counter = 0
+            # One batch covers every limit
+            max_sims = max(sim_counts)
+            df_games = simulate_limits(np.repeat(limits_to_test, max_sims), "random")
 
             for limit in limits_to_test:
-                max_sims = max(sim_counts)
-                current_batch = [play_game(limit)['count'] for _ in range(max_sims)]
-                batch_series = pd.Series(current_batch)
+                batch_series = df_games.loc[df_games['limit'] == limit, 'count'].reset_index(drop=True)
                 theoretical = 2 * math.log(limit)
 
                 for n in sim_counts:
@@ -174,13 +176,11 @@ with tab3:
                         "n_simulations": n,
                         "ratio": subset_avg / theoretical
                     })
-                step_counter += 1
-                progress_bar.progress(step_counter / total_steps)
 
             df_scale = pd.DataFrame(summary_data)
 
             # PLOTTING WITH GLOBAL CONFIG
-            fig, ax = plt.subplots(figsize=PLOT_CONFIG["figsize"], dpi=PLOT_CONFIG["dpi"])
+            fig, ax = new_figure()
 
             for limit in limits_to_test:
                 subset = df_scale[df_scale['limit'] == limit]
@@ -208,14 +208,16 @@ with tab4:
             comp_limits = [100, 1000, 10000, 100000]
             comp_results = []
 
-            for limit in comp_limits:
-                r_avg = sum([play_game(limit)['count'] for _ in range(50)]) / 50
-                o_avg = sum([play_optimal_game(limit)['count'] for _ in range(50)]) / 50
+            # One batch per strategy covers every limit
+            upper_bounds = np.repeat(comp_limits, 50)
+            r_avg = counts_by_limit(simulate_limits(upper_bounds, "random"))['mean']
+            o_avg = counts_by_limit(simulate_limits(upper_bounds, "optimal"))['mean']
 
+            for limit in comp_limits:
                 comp_results.append({
                     "limit": limit,
-                    "Random": r_avg,
-                    "Optimal": o_avg,
+                    "Random": r_avg[limit],
+                    "Optimal": o_avg[limit],
                     "Theory (Log2)": math.log2(limit)
                 })
 
@@ -236,7 +238,7 @@ with tab4:
             st.divider()
 
             # PLOTTING WITH GLOBAL CONFIG
-            fig, ax = plt.subplots(figsize=PLOT_CONFIG["figsize"], dpi=PLOT_CONFIG["dpi"])
+            fig, ax = new_figure()
 
             x_vals = df_comp['limit'].astype(str)
             ax.plot(x_vals, df_comp['Random'], marker='o', label='Random', color='blue')
@@ -281,7 +283,7 @@ with tab5:
     st.write("Peaks indicate numbers humans are more likely to pick (e.g., dates, primes).")
 
     # PLOTTING WITH GLOBAL CONFIG
-    fig, ax = plt.subplots(figsize=PLOT_CONFIG["figsize"], dpi=PLOT_CONFIG["dpi"])
+    fig, ax = new_figure()
     ax.bar(df_bias["Number"], df_bias["Probability"], color='purple', alpha=0.7)
     ax.set_xlabel("Number Selection")
     ax.set_ylabel("Probability")
@@ -336,7 +338,7 @@ with tab5:
                 'Bayesian (Human-Aware)': bayesian_scores
             })
 
-            fig, ax = plt.subplots(figsize=PLOT_CONFIG["figsize"], dpi=PLOT_CONFIG["dpi"])
+            fig, ax = new_figure()
 
             # Kernel Density Estimate (KDE) plot
             df_density.plot(kind='density', ax=ax, linewidth=2)
@@ -1,5 +1,6 @@
 # compare_strategies.py
-from game_engine import play_game, play_optimal_game
+from game_engine import simulate_limits, counts_by_limit
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import math
@@ -8,35 +9,29 @@ if __name__ == "__main__":
     print("Starting Head-to-Head Comparison...")
 
     limits = [100, 1000, 10000, 100000, 1000000]
-    results = []
 
     # Run 1000 simulations for each limit to get stable averages
     SIM_COUNT = 1000
 
-    for limit in limits:
-        print(f"Testing Limit: {limit}")
+    # Every limit is simulated in one batch; both strategies face the same targets
+    upper_bounds = np.repeat(limits, SIM_COUNT)
+    targets = np.random.default_rng().integers(1, upper_bounds + 1)
 
-        # 1. Test Random Strategy (Your original code)
-        random_counts = []
-        for _ in range(SIM_COUNT):
-            data = play_game(limit)
-            random_counts.append(data['count'])
-        avg_random = sum(random_counts) / len(random_counts)
+    # 1. Test Random Strategy (Your original code)
+    avg_random = counts_by_limit(simulate_limits(upper_bounds, "random", targets))['mean']
 
-        # 2. Test Optimal Strategy (The new code)
-        optimal_counts = []
-        for _ in range(SIM_COUNT):
-            data = play_optimal_game(limit)
-            optimal_counts.append(data['count'])
-        avg_optimal = sum(optimal_counts) / len(optimal_counts)
+    # 2. Test Optimal Strategy (The new code)
+    avg_optimal = counts_by_limit(simulate_limits(upper_bounds, "optimal", targets))['mean']
 
+    results = []
+    for limit in limits:
         # 3. Calculate Theory (Log Base 2 for optimal)
         theory_log2 = math.log2(limit)
 
         results.append({
             "limit": limit,
-            "Random_Avg": avg_random,
-            "Optimal_Avg": avg_optimal,
+            "Random_Avg": avg_random[limit],
+            "Optimal_Avg": avg_optimal[limit],
             "Theory_Log2": theory_log2
         })
 
@@ -5,31 +5,88 @@
 #### Import packages ####
 import random
 import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MaxNLocator
 
 #### Game functions ####
-def play_game(upper_bound=10, fixed_target=None):
+# Every game runs from its own seeded GameStream, and a result only keeps
+# (seed, target, count, limit). The guess history is regenerated on demand by
+# replay_game(), so big batches never have to store a list per game.
+
+_MASK64 = (1 << 64) - 1
+
+class GameStream:
+    """
+    A per-game generator: a 64-bit LCG (Knuth's MMIX constants) whose seed is
+    scrambled once with the SplitMix64 finalizer, so nearby seeds give unrelated games.
+    Seeding costs about a microsecond, where random.Random(seed) spends about 16,
+    more than a whole game at N=100.
+    """
+    __slots__ = ("state",)
+
+    def __init__(self, seed):
+        x = seed & _MASK64
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+        self.state = x ^ (x >> 31)
+
+    def getrandbits(self, k=64):
+        """k (at most 64) random bits, taken from the top of the state."""
+        self.state = x = (self.state * 6364136223846793005 + 1442695040888963407) & _MASK64
+        return x >> (64 - k)
+
+    def randint(self, a, b):
+        """A number in a..b (multiply-shift, so the bias is below (b - a + 1) / 2**64)."""
+        self.state = x = (self.state * 6364136223846793005 + 1442695040888963407) & _MASK64
+        return a + ((x * (b - a + 1)) >> 64)
+
+    def random(self):
+        """A float in [0, 1)."""
+        return self.getrandbits(53) * (1.0 / (1 << 53))
+
+def _new_seed():
+    return random.getrandbits(64)
+
+def _game_record(seed, target, count, upper_bound, guesses=None):
+    result = {
+        "seed": seed,
+        "target": target,
+        "count": count,
+        "limit": upper_bound
+    }
+    if guesses is not None:
+        result["history"] = guesses
+    return result
+
+def play_game(upper_bound=10, fixed_target=None, seed=None, keep_history=False):
     """
     Plays the 'Random Choice' model.
     It guesses randomly, but respects the feedback (High/Low) to narrow the range.
     """
-    current_guess = 0
-    guesses = []
-
-    # Allow a pre-set target (e.g., from Human choice), otherwise random
-    if fixed_target is None:
-        target = random.randint(1, upper_bound)
-    else:
+    if seed is None:
+        seed = _new_seed()
+    rng = GameStream(seed)
+
+    # The target is always drawn first, so a pre-set target (e.g., from Human choice)
+    # leaves the guessing stream exactly as it would be in a replay
+    target = rng.randint(1, upper_bound)
+    if fixed_target is not None:
         target = fixed_target
 
+    current_guess = 0
+    count = 0
+    guesses = [] if keep_history else None
+
     p1 = 1
     p2 = upper_bound
 
     while current_guess != target:
         # Guess a random number within the current valid range
-        current_guess = random.randint(p1, p2)
-        guesses.append(current_guess)
+        current_guess = rng.randint(p1, p2)
+        count += 1
+        if keep_history:
+            guesses.append(current_guess)
 
         if current_guess == target:
             break
@@ -38,28 +95,29 @@ def play_game(upper_bound=10, fixed_target=None):
         else:
             p1 = current_guess + 1
 
-    return {
-        "target": target,
-        "count": len(guesses),
-        "history": guesses,
-        "limit": upper_bound
-    }
+    return _game_record(seed, target, count, upper_bound, guesses)
 
-def play_optimal_game(upper_bound=10, fixed_target=None):
-    current_guess = 0
-    guesses = []
+def play_optimal_game(upper_bound=10, fixed_target=None, seed=None, keep_history=False):
+    if seed is None:
+        seed = _new_seed()
+    rng = GameStream(seed)
 
-    if fixed_target is None:
-        target = random.randint(1, upper_bound)
-    else:
+    target = rng.randint(1, upper_bound)
+    if fixed_target is not None:
         target = fixed_target # Use the pre-selected "Human" target
 
+    current_guess = 0
+    count = 0
+    guesses = [] if keep_history else None
+
     p1 = 1
     p2 = upper_bound
 
     while current_guess != target:
         current_guess = (p1 + p2) // 2
-        guesses.append(current_guess)
+        count += 1
+        if keep_history:
+            guesses.append(current_guess)
         if current_guess == target:
             break
         elif current_guess > target:
@@ -67,12 +125,35 @@ def play_optimal_game(upper_bound=10, fixed_target=None):
         else:
             p1 = current_guess + 1
 
-    return {
-        "target": target,
-        "count": len(guesses),
-        "history": guesses,
-        "limit": upper_bound
-    }
+    return _game_record(seed, target, count, upper_bound, guesses)
+
+#### Batches & Replay ####
+# 16 bytes per game: enough to regenerate any game exactly
+RECORD_DTYPE = np.dtype([("seed", "u8"), ("target", "u4"), ("count", "u4")])
+
+def play_batch(strategy, upper_bound, n_games, seed=None, **kwargs):
+    """
+    Plays n_games of a strategy (e.g. play_game) with one seed per game,
+    drawn from a master stream, and returns a RECORD_DTYPE array.
+    """
+    master = random.Random(seed)
+    records = np.empty(n_games, dtype=RECORD_DTYPE)
+    for i in range(n_games):
+        game_seed = master.getrandbits(64)
+        result = strategy(upper_bound, seed=game_seed, **kwargs)
+        records[i] = (game_seed, result["target"], result["count"])
+    return records
+
+def replay_game(strategy, record, upper_bound=None, **kwargs):
+    """
+    Regenerates a game (with its full history) from a result dict or a
+    RECORD_DTYPE row. Pass upper_bound when the record does not carry its limit,
+    and the same keyword arguments (e.g. prior) the game was played with.
+    """
+    if upper_bound is None:
+        upper_bound = record["limit"]
+    return strategy(int(upper_bound), fixed_target=int(record["target"]),
+                    seed=int(record["seed"]), keep_history=True, **kwargs)
 
 
 #### Plot function ####
@@ -112,11 +193,20 @@ def plot_game(result):
 
 #### Human Influence ####
 
+# The biases below switch on at these limits and change weights of smaller numbers, so
+# the weights of 1..N are the first N weights of a larger limit only between two edges.
+_HUMAN_BIAS_EDGES = (31, 100, 101, 1950, 1951)
+
 def get_human_probabilities(limit):
     """
     Creates a probability distribution that mimics human bias.
     Optimized for LARGE limits using 'PIN Code' psychology.
     """
+    weights = _human_weights(limit)
+    return weights / weights.sum()
+
+def _human_weights(limit):
+    """Unnormalized human weights of 1..limit."""
     weights = np.ones(limit + 1)  # Start with uniform weights
 
     # ---------------------------------------------------------
@@ -175,48 +265,183 @@ def get_human_probabilities(limit):
     # 5. ROUND NUMBER AVOIDANCE (The "Randomness" Fallacy)
     # ---------------------------------------------------------
     # Humans think 5000 is "not random enough", so they pick 4892.
-    for i in range(1, limit + 1):
-        if i % 1000 == 0:
-            weights[i] *= 0.1  # Crush clean thousands
-        elif i % 100 == 0:
-            weights[i] *= 0.3  # Punish clean hundreds
-
-    # Normalize so they sum to 1
-    probabilities = weights[1:] / weights[1:].sum()
-    return probabilities
+    round_penalty = np.ones(limit + 1)
+    round_penalty[100::100] = 0.3  # Punish clean hundreds
+    round_penalty[1000::1000] = 0.1  # Crush clean thousands
+    weights *= round_penalty
+    return weights[1:]
 
-def play_human_game(upper_bound=100):
+def play_human_game(upper_bound=100, seed=None):
     """
     Simulates a target chosen by a HUMAN (biased).
     Runs both Optimal (Binary) and Random Choice models against this target.
     """
+    if seed is None:
+        seed = _new_seed()
+    rng = GameStream(seed)
+
     # 1. Generate the Human Target
     probs = get_human_probabilities(upper_bound)
-    target = np.random.choice(range(1, upper_bound + 1), p=probs)
+    target = _sample_probabilities(probs, rng.random())
 
     # 2. Run Optimal Strategy against this target
-    # (We cast target to int because numpy types can sometimes cause issues)
-    optimal_result = play_optimal_game(upper_bound, fixed_target=int(target))
+    optimal_result = play_optimal_game(upper_bound, fixed_target=target, seed=rng.getrandbits(64))
 
     # 3. Run Random Choice Strategy against the SAME target
-    random_result = play_game(upper_bound, fixed_target=int(target))
+    random_result = play_game(upper_bound, fixed_target=target, seed=rng.getrandbits(64))
 
     # 4. Return both results
     return {
+        "seed": seed,
         "optimal": optimal_result,
         "random": random_result
     }
 
-def play_bayesian_game(upper_bound=100):
+def _sample_probabilities(probs, u):
+    """Inverse-CDF draw of a number 1..len(probs) from a uniform draw u."""
+    index = int(np.searchsorted(np.cumsum(probs), u * probs.sum(), side='right'))
+    return min(index, len(probs) - 1) + 1
+
+#### Learned Human Prior ####
+
+class HumanPrior:
+    """
+    A human-bias prior learned from a stream of observed picks.
+    Counts live in a Fenwick (binary indexed) tree, so adding an observation,
+    a prefix sum and a median/sample query are all O(log N). No observation
+    ever forces the full probability vector to be rebuilt.
+    """
+
+    def __init__(self, limit, pseudo_count=1.0, base=None):
+        """
+        limit:        numbers are picked from 1..limit
+        pseudo_count: mass every number starts with (keeps unseen numbers possible)
+        base:         optional starting weights (e.g. get_human_probabilities(limit)),
+                      scaled so they add up to pseudo_count * limit
+        """
+        limit = int(limit)
+        self.limit = limit
+        if base is None:
+            weights = np.full(limit, float(pseudo_count))
+        else:
+            weights = np.asarray(base, dtype=float)
+            weights = weights * (pseudo_count * limit / weights.sum())
+
+        # O(N) build, done once: each node i holds the sum of (i - lowbit(i), i]
+        cumulative = np.concatenate(([0.0], np.cumsum(weights)))
+        nodes = np.arange(limit + 1)
+        tree = cumulative - cumulative[nodes - (nodes & -nodes)]
+        self._tree = tree  # 8 bytes per number, even for very large limits
+        self._top_bit = 1 << (limit.bit_length() - 1)
+        self.total = float(weights.sum())
+        self.observations = 0
+
+    def _add(self, value, weight):
+        tree = self._tree
+        i = value
+        while i <= self.limit:
+            tree[i] += weight
+            i += i & -i
+        self.total += weight
+
+    def observe(self, value, weight=1.0):
+        """Records a single observed pick in O(log N)."""
+        if not 1 <= value <= self.limit:
+            raise ValueError(f"Observation {value} is outside 1..{self.limit}")
+        # A negative or NaN weight would break the monotone prefix sums that search() relies on
+        if not (np.isfinite(weight) and weight > 0):
+            raise ValueError(f"Observation weight must be positive and finite, got {weight}")
+        self._add(int(value), weight)
+        self.observations += 1
+
+    def observe_many(self, values):
+        """
+        Records a batch of picks. Repeated values are merged first, so the cost is
+        O(U log N) for U distinct values, however long the stream is.
+        """
+        values, counts = np.unique(np.asarray(values, dtype=np.int64), return_counts=True)
+        if len(values) and (values[0] < 1 or values[-1] > self.limit):
+            raise ValueError(f"Observations must lie in 1..{self.limit}")
+        for value, count in zip(values.tolist(), counts.tolist()):
+            self._add(value, float(count))
+        self.observations += int(counts.sum())
+
+    def prefix(self, k):
+        """Total weight of the numbers 1..k."""
+        tree = self._tree
+        s = 0.0
+        i = min(int(k), self.limit)
+        while i > 0:
+            s += tree[i]
+            i -= i & -i
+        return float(s)
+
+    def search(self, mass):
+        """Smallest k such that prefix(k) >= mass."""
+        tree = self._tree
+        pos = 0
+        step = self._top_bit
+        while step:
+            nxt = pos + step
+            if nxt <= self.limit and tree[nxt] < mass:
+                pos = nxt
+                mass -= tree[nxt]
+            step >>= 1
+        return min(pos + 1, self.limit)
+
+    def quantile(self, q, low=1, high=None):
+        """The first number in [low, high] reaching fraction q of its probability mass."""
+        if high is None:
+            high = self.limit
+        base = self.prefix(low - 1)
+        mass = self.prefix(high) - base
+        return min(max(self.search(base + q * mass), low), high)
+
+    def median(self, low=1, high=None):
+        """The number splitting the probability mass of [low, high] in half."""
+        return self.quantile(0.5, low, high)
+
+    def sample(self, u=None):
+        """Draws a pick from the prior (u is an optional uniform draw in [0, 1))."""
+        if u is None:
+            u = random.random()
+        return self.search(u * self.total)
+
+    def probabilities(self):
+        """The full normalized probability vector (meant for plotting only)."""
+        # Every prefix sum at once: each pass adds one more tree node per number
+        nodes = np.arange(self.limit + 1)
+        prefix_sums = np.zeros(self.limit + 1)
+        while nodes.any():
+            prefix_sums += self._tree[nodes]
+            nodes -= nodes & -nodes
+        return np.diff(prefix_sums) / self.total
+
+def play_bayesian_game(upper_bound=100, prior=None, fixed_target=None, seed=None, keep_history=False):
     """
     Simulates a target chosen by a HUMAN (biased).
     The computer plays using BAYESIAN Search (exploiting the bias).
+    If a learned HumanPrior is given, the target is drawn from it and every
+    guess is an O(log N) median query on its Fenwick tree; upper_bound must
+    then equal prior.limit.
     """
+    if prior is not None and upper_bound != prior.limit:
+        raise ValueError(f"upper_bound {upper_bound} does not match the prior's limit {prior.limit}")
+    if seed is None:
+        seed = _new_seed()
+    rng = GameStream(seed)
+
+    if prior is not None:
+        return _play_prior_game(prior, rng, seed, fixed_target, keep_history)
+
     probs = get_human_probabilities(upper_bound)
-    target = np.random.choice(range(1, upper_bound + 1), p=probs)
+    target = _sample_probabilities(probs, rng.random())
+    if fixed_target is not None:
+        target = fixed_target
 
     current_guess = 0
-    guesses = []
+    count = 0
+    guesses = [] if keep_history else None
 
     # We maintain the current valid range
     low = 1
@@ -239,9 +464,11 @@ def play_bayesian_game(upper_bound=100):
         # 4. Find the Median (where CDF crosses 0.5)
         # This is the point that splits the *probability mass* in half, not just the range
         median_index = np.searchsorted(cdf, 0.5)
-        current_guess = low + median_index
+        current_guess = int(low + median_index)
 
-        guesses.append(int(current_guess))
+        count += 1
+        if keep_history:
+            guesses.append(current_guess)
 
         if current_guess == target:
             break
@@ -250,9 +477,293 @@ def play_bayesian_game(upper_bound=100):
         else:
             low = current_guess + 1
 
-    return {
-        "target": target,
-        "count": len(guesses),
-        "history": guesses,
-        "limit": upper_bound
-    }
+    return _game_record(seed, target, count, upper_bound, guesses)
+
+def _play_prior_game(prior, rng, seed, fixed_target, keep_history):
+    # Replays are exact as long as the prior has not learned anything new since
+    target = prior.sample(rng.random())
+    if fixed_target is not None:
+        target = fixed_target
+
+    current_guess = 0
+    count = 0
+    guesses = [] if keep_history else None
+    low = 1
+    high = prior.limit
+
+    while current_guess != target:
+        current_guess = prior.median(low, high)
+        count += 1
+        if keep_history:
+            guesses.append(current_guess)
+
+        if current_guess == target:
+            break
+        elif current_guess > target:
+            high = current_guess - 1
+        else:
+            low = current_guess + 1
+
+    return _game_record(seed, target, count, prior.limit, guesses)
+
+#### Skewed Splits ####
+# A family of guessers that split the remaining range somewhere other than the middle:
+# at fraction alpha of the range, or at quantile q of the prior mass. Either can be a
+# single value or a per-depth schedule (entry i is used for guess i+1, the last repeats).
+
+def _depth_param(param, depth):
+    if np.ndim(param) == 0:
+        return param
+    return param[min(depth, len(param) - 1)]
+
+def _check_split(param):
+    # Outside [0, 1] a guess can leave the remaining range, and the game never ends
+    if not 0 <= np.min(param) <= np.max(param) <= 1:
+        raise ValueError("Split rules must lie in [0, 1]")
+
+def _cdf_quantile(cdf, q, low, high):
+    """Like HumanPrior.quantile, but on a plain cumulative sum of probabilities."""
+    base = cdf[low - 2] if low > 1 else 0.0
+    mass = cdf[high - 1] - base
+    k = int(np.searchsorted(cdf, base + q * mass)) + 1
+    return min(max(k, low), high)
+
+def play_split_game(upper_bound=10, alpha=0.5, fixed_target=None, seed=None, keep_history=False):
+    """
+    Guesses at fraction alpha of the remaining range (alpha=0.5 is binary search).
+    """
+    _check_split(alpha)
+    if seed is None:
+        seed = _new_seed()
+    rng = GameStream(seed)
+
+    target = rng.randint(1, upper_bound)
+    if fixed_target is not None:
+        target = fixed_target
+
+    current_guess = 0
+    count = 0
+    guesses = [] if keep_history else None
+
+    p1 = 1
+    p2 = upper_bound
+
+    while current_guess != target:
+        current_guess = p1 + int(_depth_param(alpha, count) * (p2 - p1))
+        count += 1
+        if keep_history:
+            guesses.append(current_guess)
+        if current_guess == target:
+            break
+        elif current_guess > target:
+            p2 = current_guess - 1
+        else:
+            p1 = current_guess + 1
+
+    return _game_record(seed, target, count, upper_bound, guesses)
+
+def play_quantile_game(upper_bound=100, q=0.5, prior=None, fixed_target=None, seed=None, keep_history=False):
+    """
+    Simulates a target chosen by a HUMAN (biased) and guesses at quantile q of the
+    remaining probability mass (q=0.5 is Bayesian Search, up to exact ties). Uses a HumanPrior
+    if given, in which case upper_bound must equal prior.limit.
+    """
+    _check_split(q)
+    if prior is not None and upper_bound != prior.limit:
+        raise ValueError(f"upper_bound {upper_bound} does not match the prior's limit {prior.limit}")
+    if seed is None:
+        seed = _new_seed()
+    rng = GameStream(seed)
+
+    if prior is not None:
+        target = prior.sample(rng.random())
+        quantile = prior.quantile
+    else:
+        probs = get_human_probabilities(upper_bound)
+        cdf = np.cumsum(probs)
+        target = _sample_probabilities(probs, rng.random())
+        quantile = lambda q_d, low, high: _cdf_quantile(cdf, q_d, low, high)
+    if fixed_target is not None:
+        target = fixed_target
+
+    current_guess = 0
+    count = 0
+    guesses = [] if keep_history else None
+    low = 1
+    high = upper_bound
+
+    while current_guess != target:
+        current_guess = quantile(_depth_param(q, count), low, high)
+        count += 1
+        if keep_history:
+            guesses.append(current_guess)
+
+        if current_guess == target:
+            break
+        elif current_guess > target:
+            high = current_guess - 1
+        else:
+            low = current_guess + 1
+
+    return _game_record(seed, target, count, upper_bound, guesses)
+
+def _search_batch(targets, upper_bounds, next_guess):
+    """
+    Vectorized game loop shared by the batch simulators: plays one game per target
+    (each with its own upper bound) and returns the guess counts.
+    next_guess(live, low, high, depth) returns the guesses for the unfinished games.
+    """
+    target = np.asarray(targets, dtype=np.int64)
+    high = np.array(np.broadcast_to(upper_bounds, target.shape), dtype=np.int64)
+    # A target outside 1..N can never be found, so the loop would not end
+    if ((target < 1) | (target > high)).any():
+        raise ValueError("Every target must lie between 1 and its upper bound")
+    low = np.ones_like(high)
+    counts = np.zeros_like(high)
+    # Only the unfinished games are carried along
+    live = np.arange(len(target))
+
+    depth = 0
+    while len(live):
+        lo, hi = low[live], high[live]
+        guess = next_guess(live, lo, hi, depth)
+
+        counts[live] += 1
+        t = target[live]
+        low[live] = np.where(guess < t, guess + 1, lo)
+        high[live] = np.where(guess > t, guess - 1, hi)
+        live = live[guess != t]
+        depth += 1
+
+    return counts
+
+def evaluate_split_grid(rules, targets, upper_bound, probabilities=None):
+    """
+    Plays every split rule against every target in one vectorized batch.
+
+    rules:         split values (or per-depth schedules), each in [0, 1]
+    probabilities: if given, a rule is a quantile of the prior mass (play_quantile_game);
+                   otherwise it is a fraction of the range (play_split_game)
+    Returns the guess counts as an array of shape (len(rules), len(targets)).
+    """
+    depth_count = max(1 if np.ndim(r) == 0 else len(r) for r in rules)
+    schedule = np.array([[_depth_param(r, d) for d in range(depth_count)] for r in rules], dtype=float)
+    _check_split(schedule)
+
+    targets = np.asarray(targets, dtype=np.int64)
+    n_rules, n_targets = len(rules), len(targets)
+    # One flat game per (rule, target)
+    rule_of = np.repeat(np.arange(n_rules), n_targets)
+
+    if probabilities is None:
+        def next_guess(live, lo, hi, depth):
+            split = schedule[rule_of[live], min(depth, depth_count - 1)]
+            return lo + (split * (hi - lo)).astype(np.int64)
+    else:
+        cdf = np.cumsum(probabilities)
+        cdf0 = np.concatenate(([0.0], cdf))  # cdf0[k] = mass of 1..k
+
+        def next_guess(live, lo, hi, depth):
+            split = schedule[rule_of[live], min(depth, depth_count - 1)]
+            base = cdf0[lo - 1]
+            guess = np.searchsorted(cdf, base + split * (cdf0[hi] - base)) + 1
+            return np.clip(guess, lo, hi)
+
+    counts = _search_batch(np.tile(targets, n_rules), upper_bound, next_guess)
+    return counts.reshape(n_rules, n_targets)
+
+def optimize_split_rule(upper_bound, probabilities=None, grid=None, n_targets=10000, seed=None):
+    """
+    Finds the best split rule for a prior and N.
+    Targets are drawn from probabilities (uniform if None) and every rule in the grid
+    is scored on the same targets in one batch. Returns a DataFrame sorted best first.
+    """
+    if grid is None:
+        grid = np.round(np.linspace(0.05, 0.95, 19), 2).tolist()
+    rng = np.random.default_rng(seed)
+    if probabilities is None:
+        targets = rng.integers(1, upper_bound + 1, size=n_targets)
+    else:
+        index = np.searchsorted(np.cumsum(probabilities), rng.random(n_targets) * np.sum(probabilities), side='right')
+        targets = np.minimum(index, upper_bound - 1) + 1
+
+    counts = evaluate_split_grid(grid, targets, upper_bound, probabilities)
+    df = pd.DataFrame({
+        "rule": list(grid),
+        "mean": counts.mean(axis=1),
+        "std": counts.std(axis=1),
+        "max": counts.max(axis=1),
+    })
+    return df.sort_values("mean").reset_index(drop=True)
+
+#### Mixed-Limit Batches ####
+
+def simulate_limits(upper_bounds, strategy="optimal", targets=None, seed=None):
+    """
+    Simulates one game per entry of upper_bounds in a single vectorized pass, so a
+    whole N-sweep (or N drawn from a distribution) runs as one batch.
+
+    strategy: "random", "optimal", "bayesian", or a split fraction alpha (or a
+              per-depth schedule, as in play_split_game)
+    targets:  optional per-game targets (uniform, or human-biased for "bayesian", if None)
+    Returns a DataFrame with one row per game: limit, target, count.
+
+    The whole batch shares one numpy generator, so unlike play_batch these games have
+    no per-game seeds and cannot be replayed; use them for aggregate statistics.
+
+    The "bayesian" games build the human weights once per group of limits that share
+    them (see _HUMAN_BIAS_EDGES), so a game plays the same whatever other limits are
+    in the batch. They split the mass of the unnormalized weights, while
+    play_bayesian_game searches a normalized Fenwick tree: the two agree except when a
+    split lands exactly on a boundary, which rounding breaks differently (about a third
+    of the N=100 games take another path, with the same mean count).
+    """
+    is_named = isinstance(strategy, str)
+    if is_named and strategy not in ("random", "optimal", "bayesian"):
+        raise ValueError(f"Unknown strategy {strategy!r}")
+    rng = np.random.default_rng(seed)
+    upper_bounds = np.asarray(upper_bounds, dtype=np.int64)
+
+    if is_named and strategy == "bayesian":
+        draws = rng.random(len(upper_bounds)) if targets is None else None
+        targets = np.empty(len(upper_bounds), dtype=np.int64) if targets is None else np.asarray(targets)
+        counts = np.empty(len(upper_bounds), dtype=np.int64)
+        groups = np.searchsorted(_HUMAN_BIAS_EDGES, upper_bounds, side='right')
+        for group in np.unique(groups):
+            games = np.flatnonzero(groups == group)
+            limits = upper_bounds[games]
+            # Within a group the weights of 1..N are a prefix of the largest limit's
+            cdf = np.cumsum(_human_weights(int(limits.max())))
+            cdf0 = np.concatenate(([0.0], cdf))  # cdf0[k] = mass of 1..k
+            if draws is not None:
+                index = np.searchsorted(cdf, draws[games] * cdf0[limits], side='right')
+                targets[games] = np.minimum(index, limits - 1) + 1
+
+            def next_guess(live, lo, hi, depth):
+                base = cdf0[lo - 1]
+                guess = np.searchsorted(cdf, base + 0.5 * (cdf0[hi] - base)) + 1
+                return np.clip(guess, lo, hi)
+
+            counts[games] = _search_batch(targets[games], limits, next_guess)
+        return pd.DataFrame({"limit": upper_bounds, "target": targets, "count": counts})
+
+    if targets is None:
+        targets = rng.integers(1, upper_bounds + 1)
+    if is_named and strategy == "random":
+        def next_guess(live, lo, hi, depth):
+            return rng.integers(lo, hi + 1)
+    else:
+        alpha = 0.5 if is_named else strategy
+        _check_split(alpha)
+        depth_count = 1 if np.ndim(alpha) == 0 else len(alpha)
+
+        def next_guess(live, lo, hi, depth):
+            split = _depth_param(alpha, min(depth, depth_count - 1))
+            return lo + (split * (hi - lo)).astype(np.int64)
+
+    counts = _search_batch(targets, upper_bounds, next_guess)
+    return pd.DataFrame({"limit": upper_bounds, "target": np.asarray(targets), "count": counts})
+
+def counts_by_limit(df):
+    """Summarizes a simulate_limits() DataFrame per limit."""
+    return df.groupby("limit")["count"].agg(["size", "mean", "std", "max"]).rename(columns={"size": "games"})
@@ -0,0 +1,192 @@
+# load_generator.py
+# Plays many concurrent games against server.py and reports per-move latency.
+# By default it starts an in-process server, so it runs entirely locally:
+#
+#   python load_generator.py --clients 500 --sessions-per-client 40
+#   python load_generator.py --connect --port 8080     # against a running server.py
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import numpy as np
+
+from server import start_server
+
+MODES = ["picker", "random", "optimal", "bayesian"]
+
+
+class Client:
+    """One keep-alive connection issuing JSON requests one at a time."""
+
+    def __init__(self, reader, writer, latencies):
+        self.reader = reader
+        self.writer = writer
+        self.latencies = latencies
+
+    async def request(self, method, path, body=None):
+        data = json.dumps(body or {}).encode()
+        start = time.perf_counter()
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data
+        )
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        payload = json.loads(await self.reader.readexactly(length))
+        self.latencies.append(time.perf_counter() - start)
+
+        status = int(status_line.split()[1])
+        if status >= 400:
+            raise RuntimeError(f"{method} {path} -> {status}: {payload}")
+        return payload
+
+
+class Player:
+    """The human side of one game; step() makes one move and returns False once finished."""
+
+    def __init__(self, mode, limit, rng):
+        self.mode = mode
+        self.limit = limit
+        self.rng = rng
+        self.game_id = None
+        self.pending = None  # picker: (low, high) still possible; guessers: the server's guess
+        self.target = rng.randint(1, limit)
+
+    async def start(self, client):
+        reply = await client.request("POST", "/games", {"mode": self.mode, "limit": self.limit})
+        self.game_id = reply["id"]
+        self.pending = (1, self.limit) if self.mode == "picker" else reply["guess"]
+
+    async def step(self, client):
+        if self.mode == "picker":
+            # Play binary search against the server's secret number
+            low, high = self.pending
+            guess = (low + high) // 2
+            reply = await client.request("POST", f"/games/{self.game_id}/guess", {"guess": guess})
+            if reply["answer"] == "correct":
+                return False
+            self.pending = (guess + 1, high) if reply["answer"] == "higher" else (low, guess - 1)
+            return True
+
+        guess = self.pending
+        if guess == self.target:
+            answer = "correct"
+        elif guess < self.target:
+            answer = "higher"
+        else:
+            answer = "lower"
+        reply = await client.request("POST", f"/games/{self.game_id}/feedback", {"answer": answer})
+        if reply.get("finished"):
+            return False
+        self.pending = reply["guess"]
+        return True
+
+
+class LiveCounter:
+    """Counts the games in progress across every client, and the peak reached."""
+
+    def __init__(self):
+        self.live = 0
+        self.peak = 0
+
+    def started(self):
+        self.live += 1
+        self.peak = max(self.peak, self.live)
+
+    def finished(self):
+        self.live -= 1
+
+
+async def run_client(host, port, games, sessions, limit, latencies, seed, counter):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    client = Client(reader, writer, latencies)
+    finished = 0
+    try:
+        # Keep several games alive at once and move them round-robin
+        live = []
+        while live or finished + len(live) < games:
+            while len(live) < sessions and finished + len(live) < games:
+                player = Player(rng.choice(MODES), limit, rng)
+                await player.start(client)
+                counter.started()
+                live.append(player)
+            still_live = []
+            for player in live:
+                if await player.step(client):
+                    still_live.append(player)
+                else:
+                    finished += 1
+                    counter.finished()
+            live = still_live
+    finally:
+        writer.close()
+    return finished
+
+
+async def run_load(host, port, clients, sessions, games, limit, connect):
+    listener = None
+    service_times = []
+    if not connect:
+        listener, server = await start_server(host, port)
+        handle = server.handle
+
+        # Time the server's own work per request, separately from queueing
+        def timed_handle(method, path, body):
+            start = time.perf_counter()
+            reply = handle(method, path, body)
+            service_times.append(time.perf_counter() - start)
+            return reply
+        server.handle = timed_handle
+
+    latencies = []
+    counter = LiveCounter()
+    start = time.perf_counter()
+    finished = await asyncio.gather(*[
+        run_client(host, port, games, sessions, limit, latencies, seed, counter)
+        for seed in range(clients)
+    ])
+    elapsed = time.perf_counter() - start
+
+    if listener is not None:
+        server.sweeper.cancel()
+        listener.close()
+        await listener.wait_closed()
+
+    lat_ms = np.array(latencies) * 1000
+    print("--- Load Test Results ---")
+    print(f"Games finished:      {sum(finished):,}")
+    print(f"Peak live sessions:  {counter.peak:,}")
+    print(f"Requests:            {len(lat_ms):,} in {elapsed:.2f}s ({len(lat_ms) / elapsed:,.0f} req/s)")
+    print(f"Latency p50/p95/p99: {np.percentile(lat_ms, 50):.3f} / "
+          f"{np.percentile(lat_ms, 95):.3f} / {np.percentile(lat_ms, 99):.3f} ms")
+    print("(Latency is measured at the client, so it includes the queueing of all concurrent requests.)")
+    if service_times:
+        service_ms = np.array(service_times) * 1000
+        print(f"Server time p50/p99: {np.percentile(service_ms, 50):.4f} / {np.percentile(service_ms, 99):.4f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load generator for server.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--clients", type=int, default=200, help="concurrent connections")
+    parser.add_argument("--sessions-per-client", type=int, default=50, help="live games per connection")
+    parser.add_argument("--games", type=int, default=100, help="games played per connection")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--connect", action="store_true", help="use an already running server")
+    args = parser.parse_args()
+
+    asyncio.run(run_load(args.host, args.port, args.clients, args.sessions_per_client,
+                         args.games, args.limit, args.connect))
@@ -0,0 +1,231 @@
+# load_test_app.py
+# Load test for the Streamlit dashboard (app.py) on one real `streamlit run` server.
+# Each simulated analyst is a websocket client that clicks through all five tabs the
+# way the browser does, so every session runs in the same server process, sharing its
+# caches and its GIL. Sessions connect and wait for each other first, so they click
+# together. Memory is the server's peak RSS over its idle baseline (app loaded, no
+# session open); CPU is the server's total, as sessions share one process.
+#
+#   python load_test_app.py --sessions 30 --rounds 2 --csv load_test.csv
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pandas as pd
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+# (tab, action) in the order an analyst clicks through the dashboard
+STEPS = [
+    ("Distribution", lambda s: s.click("Run Simulation")),
+    ("Game Inspector (new game)", lambda s: s.click("Play & Plot")),
+    ("Game Inspector (unluckiest)", lambda s: s.choose("View Unluckiest from Batch (Tab 1)")),
+    ("Scaling Convergence", lambda s: s.click("Run Scaling Experiment")),
+    ("Strategy Compare", lambda s: s.click("Run Comparison")),
+    ("Human Mode", lambda s: s.click("Run Large Experiment")),
+]
+
+
+class Session:
+    """One analyst's browser tab; click() and choose() queue widget changes for the next run()."""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.widgets = {}  # label (or radio option) -> widget, as last rendered
+        self.pending = []
+
+    @classmethod
+    async def connect(cls, port):
+        ws = await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"])
+        return cls(ws)
+
+    def click(self, label):
+        self.pending.append(WidgetState(id=self.widgets[label].id, trigger_value=True))
+
+    def choose(self, option):
+        radio = self.widgets[option]
+        self.pending.append(WidgetState(id=radio.id, int_value=list(radio.options).index(option)))
+
+    async def run(self, timeout):
+        """Reruns the script with the queued changes; returns (latency, error message or None)."""
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(self.pending)
+        self.pending = []
+        start = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+
+        error = None
+        while True:
+            remaining = timeout - (time.perf_counter() - start)
+            raw = await asyncio.wait_for(self.ws.read_message(), max(remaining, 0))
+            if raw is None:
+                raise ConnectionError("The server closed the session")
+            reply = ForwardMsg()
+            reply.ParseFromString(raw)
+            kind = reply.WhichOneof("type")
+            if kind == "script_finished":
+                break
+            if kind == "delta" and reply.delta.WhichOneof("type") == "new_element":
+                element = reply.delta.new_element
+                name = element.WhichOneof("type")
+                if name == "exception":
+                    error = error or element.exception.message
+                elif name == "button":
+                    self.widgets[element.button.label] = element.button
+                elif name == "radio":
+                    self.widgets.update(dict.fromkeys(element.radio.options, element.radio))
+        return time.perf_counter() - start, error
+
+    def close(self):
+        self.ws.close()
+
+
+async def run_session(session, session_id, rounds, timeout):
+    """Plays one analyst session; returns its timed clicks."""
+    rows = []
+    latency, error = await session.run(timeout)
+    rows.append({"session": session_id, "round": 0, "tab": "Page Load", "latency_s": latency, "error": error})
+
+    for round_no in range(1, rounds + 1):
+        # Go back to the first inspector mode so every round replays the same clicks
+        if round_no > 1:
+            session.choose("Play New Random Game")
+        for tab, action in STEPS:
+            action(session)
+            latency, error = await session.run(timeout)
+            rows.append({"session": session_id, "round": round_no, "tab": tab,
+                         "latency_s": latency, "error": error})
+    return rows
+
+
+def _memory_mb(pid, field):
+    # VmRSS is the current resident set, VmHWM its peak; both in kB
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+    raise LookupError(field)
+
+
+def _cpu_s(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")  # utime + stime
+
+
+def start_app(app_path, port, start_timeout):
+    """Starts `streamlit run app_path` and waits until it answers its health check."""
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", app_path, "--server.port", str(port),
+         "--server.headless", "true", "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.perf_counter() + start_timeout
+    while time.perf_counter() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"streamlit did not start within {start_timeout}s")
+
+
+async def _load_test(pid, port, n_sessions, rounds, timeout, start_timeout):
+    # A first page load imports the app, so the baseline is an idle server with app.py loaded
+    warmup = await Session.connect(port)
+    await warmup.run(timeout)
+    warmup.close()
+    await asyncio.sleep(1)
+    idle_rss = _memory_mb(pid, "VmRSS")
+
+    # Every session connects before any of them clicks
+    try:
+        sessions = await asyncio.wait_for(
+            asyncio.gather(*[Session.connect(port) for _ in range(n_sessions)]), start_timeout)
+    except asyncio.TimeoutError:
+        raise RuntimeError(f"Not every session connected within {start_timeout}s") from None
+
+    cpu = _cpu_s(pid)
+    try:
+        results = await asyncio.gather(*[
+            run_session(session, i, rounds, timeout) for i, session in enumerate(sessions)
+        ])
+    finally:
+        for session in sessions:
+            session.close()
+
+    peak_rss = _memory_mb(pid, "VmHWM")
+    resources = {
+        "server_cpu_s": _cpu_s(pid) - cpu,
+        "idle_rss_mb": idle_rss,
+        "peak_rss_mb": peak_rss,
+        "added_mb": peak_rss - idle_rss,
+        "added_per_session_mb": (peak_rss - idle_rss) / n_sessions,
+    }
+    return pd.DataFrame([row for rows in results for row in rows]), resources
+
+
+def run_load_test(n_sessions, app_path="app.py", rounds=1, timeout=600, start_timeout=120, port=8599):
+    """Runs n_sessions concurrent analysts on one server; returns (step DataFrame, server resources)."""
+    proc = start_app(app_path, port, start_timeout)
+    try:
+        return asyncio.run(_load_test(proc.pid, port, n_sessions, rounds, timeout, start_timeout))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def summarize(df_steps):
+    """Latency percentiles and failed clicks per tab."""
+    grouped = df_steps.groupby("tab", sort=False)
+    return pd.DataFrame({
+        "clicks": grouped.size(),
+        "errors": grouped["error"].count(),
+        "p50_s": grouped["latency_s"].quantile(0.50),
+        "p95_s": grouped["latency_s"].quantile(0.95),
+        "p99_s": grouped["latency_s"].quantile(0.99),
+        "max_s": grouped["latency_s"].max(),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent-user load test for app.py")
+    parser.add_argument("--sessions", type=int, default=4, help="concurrent analyst sessions")
+    parser.add_argument("--rounds", type=int, default=1, help="passes through all tabs per session")
+    parser.add_argument("--app", default="app.py")
+    parser.add_argument("--port", type=int, default=8599, help="port for the streamlit server under test")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds allowed per click")
+    parser.add_argument("--start-timeout", type=float, default=120,
+                        help="seconds to wait for the server and for every session to connect")
+    parser.add_argument("--csv", help="also save every timed click to this CSV file")
+    args = parser.parse_args()
+
+    print(f"Starting {args.sessions} concurrent sessions...")
+    start = time.perf_counter()
+    df_steps, resources = run_load_test(args.sessions, args.app, args.rounds, args.timeout,
+                                        args.start_timeout, args.port)
+    elapsed = time.perf_counter() - start
+
+    pd.set_option("display.width", 120)
+    print(f"\n--- Per-Tab Latency ({args.sessions} sessions, {elapsed:.1f}s total) ---")
+    print(summarize(df_steps).round(3))
+    print("\n--- Server Resources ---")
+    print(f"CPU:    {resources['server_cpu_s']:.1f}s "
+          f"({resources['server_cpu_s'] / len(df_steps):.3f}s per click)")
+    print(f"Memory: {resources['idle_rss_mb']:.0f} MB idle, {resources['peak_rss_mb']:.0f} MB peak, "
+          f"+{resources['added_mb']:.0f} MB (+{resources['added_per_session_mb']:.1f} MB per session)")
+
+    errors = df_steps.dropna(subset=["error"])
+    if len(errors):
+        print(f"\n{len(errors)} clicks raised, first: {errors['error'].iloc[0]}")
+    if args.csv:
+        df_steps.to_csv(args.csv, index=False)
+        print(f"\nSaved {len(df_steps)} timed clicks to {args.csv}")
@@ -1,7 +1,7 @@
 # Higher or Lower Game Analysis
 
 # main.py
-from game_engine import play_game, plot_game
+from game_engine import play_game, plot_game, play_batch, replay_game
 import math
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -11,15 +11,12 @@ if __name__ == "__main__":
     print("Starting simulation...")
     count = 1000
     limit = 10000
-    results = []
 
-    # 2. The Loop
-    for _ in range(count):
-        data = play_game(limit)
-        results.append(data)
+    # 2. The Loop (each game keeps only its seed, target and count)
+    records = play_batch(play_game, limit, count)
 
     # 3. Create DataFrame
-    df = pd.DataFrame(results)
+    df = pd.DataFrame(records)
 
     # 4. Basic Analysis
     print("--- Simulation Results ---")
@@ -50,11 +47,7 @@ if __name__ == "__main__":
     # Find the row(s) where count == max_attempts
     worst_games = df[df['count'] == max_attempts]
 
-    # Grab the raw dictionary of the first matching game
-    worst_game_data = {
-        "history": worst_games.iloc[0]['history'],
-        "target": worst_games.iloc[0]['target'],
-        "limit": limit
-    }
+    # Regenerate the full history of the first matching game from its seed
+    worst_game_data = replay_game(play_game, worst_games.iloc[0], upper_bound=limit)
     print("Plotting the unluckiest game...")
     plot_game(worst_game_data)
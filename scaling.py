@@ -1,6 +1,7 @@
 # scaling_v2.py
-from game_engine import play_game
+from game_engine import simulate_limits
 import math
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
@@ -14,18 +15,14 @@ if __name__ == "__main__":
     # We will store the SUMMARY data here (not every single game)
     summary_data = []
 
-    for limit in limits_to_test:
-        print(f"Running games for Limit: {limit}...")
-
-        max_sims = max(sim_counts_to_test)
-        current_batch = []
+    # 1. Run the games for every limit in one batch
+    max_sims = max(sim_counts_to_test)
+    print(f"Running {max_sims} games for each of {len(limits_to_test)} limits...")
+    df_games = simulate_limits(np.repeat(limits_to_test, max_sims), "random")
 
-        for _ in range(max_sims):
-            result = play_game(limit)
-            current_batch.append(result['count'])
-
-        # 2. Convert this batch to a Series for easy math
-        batch_series = pd.Series(current_batch)
+    for limit in limits_to_test:
+        # 2. Convert this limit's batch to a Series for easy math
+        batch_series = df_games.loc[df_games['limit'] == limit, 'count'].reset_index(drop=True)
         theoretical = 2 * math.log(limit)
 
         # 3. "Slice" the data for each simulation size we want to test
@@ -0,0 +1,407 @@
+# server.py
+# Serves 'Higher or Lower' to real players over a small asyncio HTTP/JSON API.
+# The server either picks the number (the player guesses) or plays any of the
+# engine's guessers (the player keeps a number in mind and answers higher/lower).
+#
+#   POST   /games             {"mode": "picker" | "random" | "optimal" | "bayesian", "limit": 100}
+#   POST   /games/<id>/guess     {"guess": 42}         (picker games)
+#   POST   /games/<id>/feedback  {"answer": "higher" | "lower" | "correct"}   (guesser games)
+#   GET    /games/<id>
+#   DELETE /games/<id>
+#   GET    /stats
+#
+# Bayesian games are limited to MAX_BAYESIAN_LIMIT: each new limit needs an O(N) prior,
+# which is built in a worker thread (common limits are built at startup) so it never
+# stalls the moves of other sessions. Games nobody has moved for IDLE_TIMEOUT seconds
+# are dropped by a periodic sweep.
+#
+# Run with: python server.py [--port 8080]
+import argparse
+import asyncio
+import functools
+import itertools
+import json
+import random
+import time
+from collections import OrderedDict, deque
+
+from game_engine import HumanPrior, get_human_probabilities
+
+MAX_LIMIT = 10_000_000
+MAX_BAYESIAN_LIMIT = 1_000_000
+PREBUILT_LIMITS = (10, 100, 1000, 10000, 100000)
+IDLE_TIMEOUT = 600     # seconds without a move before a game is dropped
+SWEEP_INTERVAL = 30    # seconds between sweeps for idle games
+ANSWERS = ("higher", "lower", "correct")
+
+# Shared by every session: random sessions only need a source of guesses, not a stream each
+_rng = random.Random()
+
+
+#### Cached priors ####
+
+@functools.lru_cache(maxsize=16)
+def cached_prior(limit):
+    """One Fenwick-tree prior per limit, built once and shared by every Bayesian session."""
+    return HumanPrior(limit, base=get_human_probabilities(limit))
+
+
+#### Sessions ####
+# A session is only (low, high, target, count). For guesser sessions, 'target'
+# holds the guess the server is waiting on feedback for.
+
+class Session:
+    __slots__ = ("low", "high", "target", "count")
+    mode = None
+
+    def __init__(self, limit):
+        self.low = 1
+        self.high = limit
+        self.target = 0
+        self.count = 0
+
+    def state(self):
+        return {"mode": self.mode, "low": self.low, "high": self.high, "count": self.count}
+
+
+class PickerSession(Session):
+    """The server picks a number, the player guesses it."""
+    __slots__ = ()
+    mode = "picker"
+
+    def start(self):
+        self.target = _rng.randint(self.low, self.high)
+        return {}
+
+    def guess(self, value):
+        self.count += 1
+        if value == self.target:
+            return "correct"
+        elif value < self.target:
+            self.low = max(self.low, value + 1)
+            return "higher"
+        else:
+            self.high = min(self.high, value - 1)
+            return "lower"
+
+
+class GuesserSession(Session):
+    """
+    The player picks a number, the server guesses it.
+    Subclasses define next_guess() for the current [low, high].
+    """
+    __slots__ = ()
+
+    def start(self):
+        self.target = self.next_guess()
+        self.count = 1
+        return {"guess": self.target}
+
+    def feedback(self, answer):
+        """Applies the player's answer; returns the next guess, or None once it is correct."""
+        if answer == "correct":
+            return None
+        low, high = self.low, self.high
+        if answer == "higher":
+            low = self.target + 1
+        else:
+            high = self.target - 1
+        # Only commit the answer if some number is still possible, so the game can go on
+        if low > high:
+            raise ValueError("Answers are inconsistent: no number is left")
+        self.low, self.high = low, high
+        self.target = self.next_guess()
+        self.count += 1
+        return self.target
+
+
+class RandomGuesser(GuesserSession):
+    __slots__ = ()
+    mode = "random"
+
+    def next_guess(self):
+        return _rng.randint(self.low, self.high)
+
+
+class OptimalGuesser(GuesserSession):
+    __slots__ = ()
+    mode = "optimal"
+
+    def next_guess(self):
+        return (self.low + self.high) // 2
+
+
+@functools.lru_cache(maxsize=16)
+def _bayesian_guesser(limit):
+    # The prior lives on a per-limit class, so instances stay at four slots
+    class BayesianGuesser(GuesserSession):
+        __slots__ = ()
+        mode = "bayesian"
+        prior = cached_prior(limit)
+
+        def next_guess(self):
+            return self.prior.median(self.low, self.high)
+
+    return BayesianGuesser
+
+
+SESSION_TYPES = {
+    "picker": lambda limit: PickerSession,
+    "random": lambda limit: RandomGuesser,
+    "optimal": lambda limit: OptimalGuesser,
+    "bayesian": _bayesian_guesser,
+}
+
+
+#### Request handling ####
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _int_field(body, name):
+    value = body.get(name)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ApiError(400, f"'{name}' must be an integer")
+    return value
+
+
+class GameServer:
+    """
+    Holds every live session; handle() maps one request to (status, payload).
+
+    sessions is kept in least recently moved order: every request for a game moves
+    it to the end. Each sweep() also appends a marker (a negative id mapped to None)
+    with its time, so a game still in front of a marker older than idle_timeout has
+    not moved since, and the sweep pops it from the front. Expiry costs no memory per
+    session and a sweep only touches the games it drops.
+    """
+
+    def __init__(self, max_sessions=200_000, idle_timeout=IDLE_TIMEOUT):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.sessions = OrderedDict()
+        self._ids = itertools.count(1)
+        self._markers = itertools.count(-1, -1)
+        self._marks = deque()  # (time, marker id), oldest first
+        self.games_finished = 0
+        self.games_expired = 0
+        self._prior_builds = {}
+        self.sweeper = None  # the periodic sweep task, set by start_server()
+
+    @property
+    def live_sessions(self):
+        return len(self.sessions) - len(self._marks)
+
+    def sweep(self, now=None):
+        """Drops the games idle for at least idle_timeout; returns how many were dropped."""
+        if now is None:
+            now = time.monotonic()
+        expired = 0
+        while self._marks and now - self._marks[0][0] >= self.idle_timeout:
+            _, marker = self._marks.popleft()
+            # The oldest marker is also the first one in sessions
+            while True:
+                game_id, _ = self.sessions.popitem(last=False)
+                if game_id == marker:
+                    break
+                expired += 1
+        marker = next(self._markers)
+        self.sessions[marker] = None
+        self._marks.append((now, marker))
+        self.games_expired += expired
+        return expired
+
+    async def prepare(self, method, path, body):
+        """
+        Builds the prior a new Bayesian game needs in a worker thread, so create()
+        then finds it cached. Concurrent requests for the same limit share one build.
+        """
+        if method != "POST" or path.strip("/") != "games" or body.get("mode") != "bayesian":
+            return
+        limit = body.get("limit")
+        if isinstance(limit, bool) or not isinstance(limit, int) or not 1 <= limit <= MAX_BAYESIAN_LIMIT:
+            return  # create() reports the error
+        build = self._prior_builds.get(limit)
+        if build is None:
+            build = asyncio.get_running_loop().run_in_executor(None, _bayesian_guesser, limit)
+            self._prior_builds[limit] = build
+            build.add_done_callback(lambda _: self._prior_builds.pop(limit, None))
+        await build
+
+    def handle(self, method, path, body):
+        try:
+            parts = path.strip("/").split("/")
+            if parts == ["games"] and method == "POST":
+                return 201, self.create(body)
+            if parts == ["stats"] and method == "GET":
+                return 200, {"sessions": self.live_sessions, "finished": self.games_finished,
+                             "expired": self.games_expired}
+            if len(parts) >= 2 and parts[0] == "games":
+                game_id = self._lookup(parts[1])
+                if len(parts) == 2 and method == "GET":
+                    return 200, self.sessions[game_id].state()
+                if len(parts) == 2 and method == "DELETE":
+                    del self.sessions[game_id]
+                    return 200, {"deleted": game_id}
+                if len(parts) == 3 and method == "POST" and parts[2] == "guess":
+                    return 200, self.guess(game_id, body)
+                if len(parts) == 3 and method == "POST" and parts[2] == "feedback":
+                    return 200, self.feedback(game_id, body)
+            raise ApiError(404, f"No route for {method} {path}")
+        except ApiError as e:
+            return e.status, {"error": str(e)}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+
+    def _lookup(self, raw_id):
+        try:
+            game_id = int(raw_id)
+        except ValueError:
+            raise ApiError(404, f"Unknown game '{raw_id}'")
+        if game_id < 1 or game_id not in self.sessions:
+            raise ApiError(404, f"Unknown game '{raw_id}'")
+        self.sessions.move_to_end(game_id)
+        return game_id
+
+    def create(self, body):
+        mode = body.get("mode", "picker")
+        if mode not in SESSION_TYPES:
+            raise ApiError(400, f"'mode' must be one of {sorted(SESSION_TYPES)}")
+        limit = _int_field(body, "limit")
+        max_limit = MAX_BAYESIAN_LIMIT if mode == "bayesian" else MAX_LIMIT
+        if not 1 <= limit <= max_limit:
+            raise ApiError(400, f"'limit' must be between 1 and {max_limit} for {mode} games")
+        if self.live_sessions >= self.max_sessions:
+            raise ApiError(503, "Too many live games, try again later")
+
+        session = SESSION_TYPES[mode](limit)(limit)
+        game_id = next(self._ids)
+        self.sessions[game_id] = session
+        return {"id": game_id, "mode": mode, **session.start()}
+
+    def guess(self, game_id, body):
+        session = self.sessions[game_id]
+        if session.mode != "picker":
+            raise ApiError(400, "This game expects 'feedback', not guesses")
+        answer = session.guess(_int_field(body, "guess"))
+        if answer == "correct":
+            self._finish(game_id)
+        return {"answer": answer, "count": session.count}
+
+    def feedback(self, game_id, body):
+        session = self.sessions[game_id]
+        if session.mode == "picker":
+            raise ApiError(400, "This game expects guesses, not 'feedback'")
+        answer = body.get("answer")
+        if answer not in ANSWERS:
+            raise ApiError(400, f"'answer' must be one of {list(ANSWERS)}")
+        guess = session.feedback(answer)
+        if guess is None:
+            self._finish(game_id)
+            return {"finished": True, "count": session.count}
+        return {"guess": guess, "count": session.count}
+
+    def _finish(self, game_id):
+        del self.sessions[game_id]
+        self.games_finished += 1
+
+
+#### HTTP layer ####
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+           413: "Payload Too Large", 503: "Service Unavailable"}
+MAX_BODY = 64 * 1024
+
+
+async def _serve_connection(server, reader, writer):
+    # HTTP/1.1 with keep-alive: one connection can carry a whole game
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+            length = 0
+            keep_alive = True
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                name = name.strip().lower()
+                if name == "content-length":
+                    length = int(value)
+                elif name == "connection":
+                    keep_alive = value.strip().lower() != "close"
+
+            if length > MAX_BODY:
+                status, payload = 413, {"error": "Request body too large"}
+                keep_alive = False
+            else:
+                raw = await reader.readexactly(length) if length else b""
+                try:
+                    body = json.loads(raw) if raw else {}
+                except json.JSONDecodeError:
+                    body = None
+                if not isinstance(body, dict):
+                    status, payload = 400, {"error": "Body must be a JSON object"}
+                else:
+                    await server.prepare(method, path, body)
+                    status, payload = server.handle(method, path, body)
+
+            data = json.dumps(payload).encode()
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _sweep_forever(server, interval):
+    while True:
+        server.sweep()
+        await asyncio.sleep(interval)
+
+
+async def start_server(host="127.0.0.1", port=8080, server=None, prebuild=PREBUILT_LIMITS,
+                       sweep_interval=SWEEP_INTERVAL):
+    """Builds the priors for the common limits, starts listening and returns (asyncio server, GameServer)."""
+    if server is None:
+        server = GameServer()
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*[loop.run_in_executor(None, _bayesian_guesser, limit) for limit in prebuild])
+    # Keep a reference, the event loop only holds tasks weakly
+    server.sweeper = loop.create_task(_sweep_forever(server, sweep_interval))
+    listener = await asyncio.start_server(
+        lambda r, w: _serve_connection(server, r, w), host, port, backlog=4096)
+    return listener, server
+
+
+async def _main(host, port):
+    listener, _ = await start_server(host, port)
+    print(f"Serving Higher or Lower on http://{host}:{port}")
+    async with listener:
+        await listener.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Higher or Lower game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_main(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from game_engine import HumanPrior, get_human_probabilities, play_bayesian_game
+
+
+@pytest.mark.parametrize("limit", [1, 7, 100, 2026])
+def test_probabilities_match_base(limit):
+    probs = get_human_probabilities(limit)
+    prior = HumanPrior(limit, base=probs)
+    assert np.allclose(prior.probabilities(), probs)
+
+
+def test_observe_updates_prefix_sums():
+    limit = 50
+    prior = HumanPrior(limit)
+    counts = np.ones(limit)
+
+    prior.observe(7)
+    prior.observe(50, weight=2.5)
+    counts[6] += 1
+    counts[49] += 2.5
+
+    picks = np.random.default_rng(0).integers(1, limit + 1, size=500)
+    prior.observe_many(picks)
+    counts += np.bincount(picks, minlength=limit + 1)[1:]
+
+    assert prior.observations == 502
+    assert prior.total == pytest.approx(counts.sum())
+    for k in range(limit + 1):
+        assert prior.prefix(k) == pytest.approx(counts[:k].sum())
+
+
+def test_observe_rejects_out_of_range():
+    prior = HumanPrior(10)
+    with pytest.raises(ValueError):
+        prior.observe(11)
+    with pytest.raises(ValueError):
+        prior.observe_many([0, 3])
+
+
+def test_search_and_quantile_match_brute_force():
+    limit = 300
+    probs = get_human_probabilities(limit)
+    prior = HumanPrior(limit, base=probs)
+    cumulative = np.cumsum(probs) * prior.total
+
+    rng = np.random.default_rng(1)
+    for mass in rng.random(200) * prior.total:
+        assert prior.search(mass) == np.searchsorted(cumulative, mass) + 1
+
+    for _ in range(200):
+        low, high = sorted(rng.integers(1, limit + 1, size=2).tolist())
+        q = rng.random()
+        window = probs[low - 1:high]
+        expected = low + np.searchsorted(np.cumsum(window) / window.sum(), q)
+        # Ties at exact mass boundaries may round either way
+        assert abs(prior.quantile(q, low, high) - expected) <= 1
+        assert low <= prior.quantile(q, low, high) <= high
+
+
+def test_bayesian_game_checks_prior_limit():
+    prior = HumanPrior(200)
+    assert play_bayesian_game(200, prior=prior)["limit"] == 200
+    with pytest.raises(ValueError):
+        play_bayesian_game(100, prior=prior)
+
+
+@pytest.mark.parametrize("weight", [0, -200, float("nan"), float("inf")])
+def test_observe_rejects_bad_weights(weight):
+    prior = HumanPrior(100)
+    with pytest.raises(ValueError):
+        prior.observe(5, weight=weight)
+    assert prior.total == 100
+
+
+def test_numpy_limit_and_probabilities_after_updates():
+    prior = HumanPrior(np.int64(1000))
+    prior.observe_many([3, 3, 999])
+    expected = np.ones(1000)
+    expected[[2, 998]] += [2, 1]
+    assert np.allclose(prior.probabilities(), expected / expected.sum())
@@ -0,0 +1,49 @@
+from functools import partial
+
+import pytest
+
+from game_engine import (RECORD_DTYPE, GameStream, HumanPrior, play_batch, play_bayesian_game,
+                         play_game, play_human_game, play_optimal_game, play_quantile_game,
+                         play_split_game, replay_game)
+
+
+@pytest.mark.parametrize("strategy", [
+    play_game,
+    play_optimal_game,
+    play_bayesian_game,
+    partial(play_split_game, alpha=0.3),
+    partial(play_quantile_game, q=0.4),
+])
+def test_replay_reproduces_batch_rows(strategy):
+    records = play_batch(strategy, 500, 200, seed=7)
+    assert records.dtype == RECORD_DTYPE and records.itemsize == 16
+    for row in records:
+        game = replay_game(strategy, row, upper_bound=500)
+        assert game["count"] == row["count"]
+        assert game["target"] == row["target"]
+        assert len(game["history"]) == row["count"]
+        assert game["history"][-1] == row["target"]
+
+
+def test_replay_with_prior_and_fixed_target():
+    prior = HumanPrior(300)
+    prior.observe_many([42, 42, 7])
+    game = play_bayesian_game(300, prior=prior)
+    replayed = replay_game(play_bayesian_game, game, prior=prior)
+    assert (replayed["count"], replayed["target"]) == (game["count"], game["target"])
+
+    human = play_human_game(300)
+    replayed = replay_game(play_game, human["random"])
+    assert replayed["count"] == human["random"]["count"]
+
+
+def test_batches_are_reproducible_from_their_seed():
+    assert (play_batch(play_game, 1000, 100, seed=3) == play_batch(play_game, 1000, 100, seed=3)).all()
+
+
+def test_game_stream_is_deterministic_and_in_range():
+    a, b = GameStream(12345), GameStream(12345)
+    draws = [a.randint(3, 9) for _ in range(2000)]
+    assert draws == [b.randint(3, 9) for _ in range(2000)]
+    assert set(draws) == set(range(3, 10))
+    assert all(0 <= a.random() < 1 for _ in range(1000))
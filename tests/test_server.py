@@ -0,0 +1,105 @@
+import asyncio
+
+from server import GameServer, start_server
+
+
+def _create(server, mode, limit=100):
+    status, reply = server.handle("POST", "/games", {"mode": mode, "limit": limit})
+    assert status == 201
+    return reply
+
+
+def test_optimal_game_plays_to_the_end():
+    server = GameServer()
+    target = 37
+    reply = _create(server, "optimal")
+    game_id, guess = reply["id"], reply["guess"]
+
+    while guess != target:
+        answer = "higher" if guess < target else "lower"
+        status, reply = server.handle("POST", f"/games/{game_id}/feedback", {"answer": answer})
+        assert status == 200
+        guess = reply["guess"]
+
+    status, reply = server.handle("POST", f"/games/{game_id}/feedback", {"answer": "correct"})
+    assert status == 200
+    assert reply == {"finished": True, "count": 3}
+    assert server.handle("GET", "/stats", {}) == (200, {"sessions": 0, "finished": 1, "expired": 0})
+    assert server.handle("GET", f"/games/{game_id}", {})[0] == 404
+
+
+def test_picker_game_answers_guesses():
+    server = GameServer()
+    game_id = _create(server, "picker", limit=1)["id"]
+    assert server.handle("POST", f"/games/{game_id}/guess", {"guess": 1}) == (200, {"answer": "correct", "count": 1})
+    assert server.handle("POST", f"/games/{game_id}/feedback", {"answer": "higher"})[0] == 404
+
+
+def test_inconsistent_answer_is_rejected_and_game_continues():
+    server = GameServer()
+    game_id = _create(server, "optimal", limit=3)["id"]  # guesses 2
+    assert server.handle("POST", f"/games/{game_id}/feedback", {"answer": "lower"}) == (200, {"guess": 1, "count": 2})
+
+    status, reply = server.handle("POST", f"/games/{game_id}/feedback", {"answer": "lower"})
+    assert status == 400
+    assert "inconsistent" in reply["error"]
+    assert server.handle("GET", f"/games/{game_id}", {}) == (
+        200, {"mode": "optimal", "low": 1, "high": 1, "count": 2})
+
+
+def test_bad_requests():
+    server = GameServer()
+    game_id = _create(server, "picker")["id"]
+    for method, path, body, status in [
+        ("GET", "/games/12345", {}, 404),
+        ("GET", "/games/abc", {}, 404),
+        ("POST", "/games/-1/guess", {"guess": 3}, 404),
+        ("POST", "/games", {"mode": "psychic", "limit": 10}, 400),
+        ("POST", "/games", {"mode": "optimal", "limit": 0}, 400),
+        ("POST", f"/games/{game_id}/guess", {"guess": "3"}, 400),
+        ("POST", f"/games/{game_id}/feedback", {"answer": "higher"}, 400),
+    ]:
+        assert server.handle(method, path, body)[0] == status
+
+
+def test_sweep_drops_only_idle_games():
+    server = GameServer(idle_timeout=60)
+    idle = _create(server, "optimal")["id"]
+    active = _create(server, "picker")["id"]
+
+    server.sweep(now=0)
+    server.sweep(now=30)
+    server.handle("POST", f"/games/{active}/guess", {"guess": 0})
+    assert server.sweep(now=60) == 1
+    assert server.handle("GET", f"/games/{idle}", {})[0] == 404
+    assert server.handle("GET", f"/games/{active}", {})[0] == 200
+
+    # Reading a game counts as activity too
+    assert server.sweep(now=200) == 0
+    assert server.sweep(now=260) == 1
+    assert server.live_sessions == 0
+    assert server.handle("GET", "/stats", {})[1]["expired"] == 2
+
+
+def test_sweep_markers_do_not_count_as_games():
+    server = GameServer(max_sessions=1)
+    for now in range(5):
+        server.sweep(now=now)
+    game_id = _create(server, "picker")["id"]
+    assert server.handle("POST", "/games", {"mode": "picker", "limit": 10})[0] == 503
+    server.handle("DELETE", f"/games/{game_id}", {})
+    _create(server, "picker")
+
+
+def test_start_server_runs_the_sweep():
+    async def main():
+        server = GameServer(idle_timeout=0)
+        listener, _ = await start_server(port=0, server=server, prebuild=(), sweep_interval=0.01)
+        _create(server, "optimal")
+        await asyncio.sleep(0.1)
+        server.sweeper.cancel()
+        listener.close()
+        await listener.wait_closed()
+        return server.games_expired
+
+    assert asyncio.run(main()) == 1
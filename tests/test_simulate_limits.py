@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from game_engine import (counts_by_limit, evaluate_split_grid, get_human_probabilities,
+                         play_optimal_game, play_split_game, simulate_limits)
+
+
+def test_optimal_matches_single_games():
+    upper_bounds = np.repeat([10, 100, 1000], 50)
+    df = simulate_limits(upper_bounds, "optimal", seed=0)
+    expected = [play_optimal_game(int(n), fixed_target=int(t))["count"]
+                for n, t in zip(df["limit"], df["target"])]
+    assert df["count"].tolist() == expected
+    assert counts_by_limit(df)["games"].tolist() == [50, 50, 50]
+
+
+def test_split_schedule_as_numpy_array():
+    upper_bounds = np.repeat([100, 1000], 30)
+    schedule = np.array([0.3, 0.5])
+    df = simulate_limits(upper_bounds, schedule, seed=1)
+    expected = [play_split_game(int(n), schedule, fixed_target=int(t))["count"]
+                for n, t in zip(df["limit"], df["target"])]
+    assert df["count"].tolist() == expected
+
+
+def test_bayesian_games_do_not_depend_on_other_limits():
+    # Includes the limits where a bias switches on (100: dates, 1950: years)
+    limits = [20, 31, 100, 101, 300, 1950, 2000]
+    df = simulate_limits(np.repeat(limits, 200), "bayesian", seed=2)
+    for limit in limits:
+        group = df[df["limit"] == limit]
+        alone = simulate_limits(np.full(len(group), limit), "bayesian", targets=group["target"])
+        assert alone["count"].tolist() == group["count"].tolist()
+
+        expected = evaluate_split_grid([0.5], group["target"], limit, get_human_probabilities(limit))[0]
+        # Rounding can break an exact 50/50 tie the other way, so compare on average
+        assert abs(group["count"].mean() - expected.mean()) < 0.1
+
+
+@pytest.mark.parametrize("targets", [[50, 150], [0, 5]])
+def test_targets_outside_range_are_rejected(targets):
+    with pytest.raises(ValueError):
+        simulate_limits([100, 100], "optimal", targets=targets)
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        simulate_limits([100], "binary")
+    with pytest.raises(ValueError):
+        simulate_limits([100], 1.5)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from game_engine import (HumanPrior, evaluate_split_grid, get_human_probabilities,
+                         play_optimal_game, play_quantile_game, play_split_game)
+
+
+def test_half_split_is_binary_search():
+    for target in range(1, 201):
+        assert (play_split_game(200, 0.5, fixed_target=target)["count"]
+                == play_optimal_game(200, fixed_target=target)["count"])
+
+
+def test_grid_matches_single_games():
+    limit = 500
+    rules = [0.3, 0.5, (0.5, 0.2)]
+    targets = np.random.default_rng(0).integers(1, limit + 1, size=100)
+
+    counts = evaluate_split_grid(rules, targets, limit)
+    for row, alpha in zip(counts, rules):
+        assert row.tolist() == [play_split_game(limit, alpha, fixed_target=int(t))["count"] for t in targets]
+
+    probs = get_human_probabilities(limit)
+    counts = evaluate_split_grid(rules, targets, limit, probs)
+    for row, q in zip(counts, rules):
+        assert row.tolist() == [play_quantile_game(limit, q, fixed_target=int(t))["count"] for t in targets]
+
+
+@pytest.mark.parametrize("rule", [1.5, -0.1, (0.5, 2.0)])
+def test_split_rules_outside_unit_interval_are_rejected(rule):
+    with pytest.raises(ValueError):
+        play_split_game(10, alpha=rule, fixed_target=5)
+    with pytest.raises(ValueError):
+        play_quantile_game(10, q=rule, fixed_target=5)
+    with pytest.raises(ValueError):
+        evaluate_split_grid([rule], [5], 10)
+
+
+def test_quantile_game_checks_prior_limit():
+    prior = HumanPrior(300)
+    assert play_quantile_game(300, 0.4, prior=prior)["limit"] == 300
+    with pytest.raises(ValueError):
+        play_quantile_game(100, 0.4, prior=prior)
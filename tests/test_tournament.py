@@ -0,0 +1,24 @@
+from functools import partial
+
+import numpy as np
+
+from game_engine import play_game, play_optimal_game
+from tournament import run_tournament
+
+
+def test_dominated_strategy_is_dropped_in_first_round():
+    df = run_tournament({"Random": play_game, "Optimal": play_optimal_game}, 1000,
+                        initial_games=100, max_games=2000, seed=0)
+    assert df["strategy"].tolist() == ["Optimal", "Random"]
+    assert np.isnan(df.loc[0, "eliminated_round"])
+    assert df.loc[1, "eliminated_round"] == 1
+    assert df.loc[1, "diff_low"] > 0
+    assert df.attrs["games_used"] == 200
+
+
+def test_identical_strategies_both_survive():
+    strategies = {"A": play_optimal_game, "B": partial(play_optimal_game)}
+    df = run_tournament(strategies, 500, initial_games=20, max_games=1000, seed=1)
+    assert df["eliminated_round"].isna().all()
+    assert (df["games"] == 500).all()
+    assert (df["diff"] == 0).all()
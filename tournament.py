@@ -0,0 +1,181 @@
+# tournament.py
+# Picks the best strategy with as few simulated games as possible.
+# Instead of giving every strategy the same fixed number of games, the budget is spent
+# in rounds: after each round, clearly worse strategies are dropped and the survivors
+# play a bigger batch.
+from functools import partial
+from statistics import NormalDist
+import math
+
+import numpy as np
+import pandas as pd
+
+from game_engine import play_game, play_optimal_game, play_bayesian_game, get_human_probabilities, HumanPrior
+
+
+def _sample_targets(rng, upper_bound, probabilities, n):
+    if probabilities is None:
+        return rng.integers(1, upper_bound + 1, size=n)
+    cdf = np.cumsum(probabilities)
+    index = np.searchsorted(cdf, rng.random(n) * cdf[-1], side='right')
+    return np.minimum(index, upper_bound - 1) + 1
+
+
+def _max_rounds(initial_games, eta, max_games):
+    """Most rounds the budget allows (reached when only two strategies are left)."""
+    rounds = 0
+    used = 0
+    batch = initial_games
+    while True:
+        batch = min(batch, (max_games - used) // 2)
+        if batch < 2:
+            return max(rounds, 1)
+        rounds += 1
+        used += 2 * batch
+        batch *= eta
+
+
+def run_tournament(strategies, upper_bound, probabilities=None, rule="racing", eta=2,
+                   initial_games=50, max_games=100_000, confidence=0.95, seed=None):
+    """
+    Runs a tournament between strategies and returns a ranking DataFrame.
+
+    strategies:    {name: strategy}, where a strategy is called like play_game
+                   (upper_bound, fixed_target=..., seed=...). Use functools.partial
+                   for parameterized variants.
+    probabilities: distribution of targets over 1..upper_bound (None = uniform),
+                   e.g. get_human_probabilities(upper_bound)
+    rule:          "racing" only drops strategies that are significantly worse than the
+                   leader; "halving" also keeps just the best 1/eta of the field each
+                   round (successive halving), which is cheaper but can drop a close
+                   runner-up on noise.
+    eta:           survivors' batch size grows by this factor each round
+    max_games:     total budget of simulated games across all strategies
+
+    Every strategy still in the field plays the same targets with the same seeds, so
+    strategies are compared on paired games: noise from the targets cancels out and
+    far fewer games are needed to separate them. The elimination test is Bonferroni
+    corrected over every candidate and every possible round, so under "racing" the
+    chance of ever dropping the truly best strategy is at most 1 - confidence (using
+    the normal approximation). If the budget runs out first, several strategies
+    survive and the best mean among them is ranked first.
+
+    The ranking holds each strategy's mean guesses with a marginal confidence interval
+    (ci_low, ci_high), plus the paired difference from the winner on the games both
+    played (diff, diff_low, diff_high) at the corrected level used for elimination.
+    A strategy can be eliminated while its marginal interval overlaps the winner's:
+    the paired interval is the one that decides.
+    """
+    if rule not in ("halving", "racing"):
+        raise ValueError("rule must be 'halving' or 'racing'")
+
+    rng = np.random.default_rng(seed)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    comparisons = max(1, len(strategies) - 1) * _max_rounds(initial_games, eta, max_games)
+    z_paired = NormalDist().inv_cdf(1 - (1 - confidence) / (2 * comparisons))
+
+    alive = list(strategies)
+    counts = {name: [] for name in strategies}
+    eliminated = {}
+    batch = initial_games
+    games_used = 0
+    round_no = 0
+
+    while len(alive) > 1:
+        batch = min(batch, (max_games - games_used) // len(alive))
+        if batch < 2:
+            break
+        round_no += 1
+
+        targets = _sample_targets(rng, upper_bound, probabilities, batch).tolist()
+        seeds = rng.integers(0, 2**63, size=batch).tolist()
+        for name in alive:
+            play = strategies[name]
+            counts[name].extend(play(upper_bound, fixed_target=t, seed=s)["count"]
+                                for t, s in zip(targets, seeds))
+        games_used += batch * len(alive)
+
+        # Paired comparison against the current leader on the shared games
+        scores = {name: np.array(counts[name], dtype=float) for name in alive}
+        leader = min(alive, key=lambda name: scores[name].mean())
+        dropped = []
+        for name in alive:
+            if name == leader:
+                continue
+            diff = scores[name] - scores[leader]
+            half_width = z_paired * diff.std(ddof=1) / math.sqrt(len(diff))
+            if diff.mean() - half_width > 0:
+                dropped.append(name)
+
+        if rule == "halving":
+            ranked = sorted(alive, key=lambda name: scores[name].mean())
+            keep = max(1, math.ceil(len(alive) / eta))
+            dropped = set(dropped) | set(ranked[keep:])
+
+        for name in dropped:
+            eliminated[name] = round_no
+        alive = [name for name in alive if name not in dropped]
+        batch *= eta
+
+    rows = []
+    for name in strategies:
+        scores = np.array(counts[name], dtype=float)
+        n = len(scores)
+        mean = scores.mean() if n else math.nan
+        half_width = z * scores.std(ddof=1) / math.sqrt(n) if n > 1 else math.nan
+        rows.append({
+            "strategy": name,
+            "games": n,
+            "mean": mean,
+            "ci_low": mean - half_width,
+            "ci_high": mean + half_width,
+            "eliminated_round": eliminated.get(name, math.nan),
+        })
+
+    df = pd.DataFrame(rows)
+    # Survivors first, then strategies that lasted longer, each ordered by mean guesses
+    df["_lasted"] = df["eliminated_round"].fillna(math.inf)
+    df = df.sort_values(["_lasted", "mean"], ascending=[False, True]).drop(columns="_lasted")
+
+    # Paired difference from the winner; the first n games of both are the same games
+    winner = np.array(counts[df["strategy"].iloc[0]], dtype=float)
+    diffs = []
+    for name in df["strategy"]:
+        scores = np.array(counts[name], dtype=float)
+        n = len(scores)
+        diff = scores - winner[:n]
+        mean = diff.mean() if n else math.nan
+        half_width = z_paired * diff.std(ddof=1) / math.sqrt(n) if n > 1 else math.nan
+        diffs.append((mean, mean - half_width, mean + half_width))
+    df["diff"], df["diff_low"], df["diff_high"] = zip(*diffs)
+
+    df.insert(0, "rank", range(1, len(df) + 1))
+    df.attrs["games_used"] = games_used
+    return df.reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    limit = 1000
+    print(f"Starting Tournament (Human targets, N={limit})...")
+
+    # A learned prior that has only seen 2,000 human picks so far
+    human_probs = get_human_probabilities(limit)
+    learned = HumanPrior(limit)
+    learned.observe_many(np.random.default_rng(1).choice(np.arange(1, limit + 1), size=2000, p=human_probs))
+
+    contenders = {
+        "Random": play_game,
+        "Optimal": play_optimal_game,
+        "Bayesian": play_bayesian_game,
+        "Bayesian (learned prior)": partial(play_bayesian_game, prior=learned),
+    }
+
+    df = run_tournament(contenders, limit, probabilities=human_probs, seed=0)
+    pd.set_option("display.width", 120)
+    pd.set_option("display.max_columns", None)
+    print("\n--- Tournament Ranking ---")
+    print(df.round(3))
+
+    used = df.attrs["games_used"]
+    fixed = len(contenders) * df["games"].max()
+    print(f"\nGames simulated: {used:,} (a fixed budget at the winner's precision needs {fixed:,})")